@@ -2,11 +2,15 @@
 from __future__ import annotations
 
 import logging
+import mmap
+import os
 import re
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, Iterable, List, Sequence, Tuple
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
 
 from .config import settings
 from .data_files import ensure_data_file
@@ -15,11 +19,20 @@ logger = logging.getLogger(__name__)
 
 MANUFACTURER_FILE = Path("manufacturer.txt")
 TOKEN_PATTERN = re.compile(r"[0-9A-Za-zА-Яа-яЁё]+")
+# Byte table mapping everything outside [0-9A-Za-z] to a space.
+ASCII_TOKEN_DELIMITERS = bytes(
+    code if chr(code).isascii() and chr(code).isalnum() else ord(" ") for code in range(256)
+)
 ARTICLE_CODE_PATTERN = re.compile(
     r"^(?:[A-Z]{2}\d{3,}|\d{3,}[-/]\d+|(?=.*\d)[A-Z0-9-]{6,})$",
     re.IGNORECASE,
 )
-GENERIC_LABEL_WORDS = {
+# Punctuation and whitespace runs collapse to a single space in one pass.
+PUNCTUATION_WS_PATTERN = re.compile(r"[\"'`~!@#$%^&*+=\[\]{}:;,.?<>№\s]+")
+NON_ALNUM_PATTERN = re.compile(r"[^0-9a-z]+")
+SEGMENT_SPLIT_PATTERN = re.compile(r"[,/|()]+")
+HYPHEN_SPLIT_PATTERN = re.compile(r"-+")
+GENERIC_LABEL_WORDS = frozenset({
     "group",
     "company",
     "co",
@@ -248,9 +261,10 @@ GENERIC_LABEL_WORDS = {
     "korea",
     "turkey",
     "russia",
-}
+})
 
-GENERIC_SUFFIXES = [
+# Tried in order: the first suffix that leaves at least four characters wins.
+GENERIC_SUFFIXES = (
     "ami",
     "yami",
     "kami",
@@ -260,9 +274,7 @@ GENERIC_SUFFIXES = [
     "ego",
     "omu",
     "emu",
-    "ami",
     "yakh",
-    "akh",
     "ov",
     "ev",
     "iy",
@@ -272,7 +284,6 @@ GENERIC_SUFFIXES = [
     "aya",
     "oy",
     "ey",
-    "iy",
     "im",
     "ym",
     "om",
@@ -289,8 +300,8 @@ GENERIC_SUFFIXES = [
     "e",
     "s",
     "es",
-]
-NOISE_STARTERS = {
+)
+NOISE_STARTERS = frozenset({
     "замок",
     "прокладка",
     "прокладки",
@@ -343,7 +354,7 @@ NOISE_STARTERS = {
     "пыльник",
     "пыльники",
     "pylnik",
-}
+})
 PRE_TRANSLIT_OVERRIDES = {
     "тойота": "toyota",
     "тайота": "toyota",
@@ -455,7 +466,7 @@ def expand_brand_filter_tokens(brand_ids: Iterable[str]) -> List[str]:
                 expanded.append(alias)
                 seen.add(alias)
     return expanded
-QUERY_STOPWORDS = {
+QUERY_STOPWORDS = frozenset({
     "the",
     "a",
     "an",
@@ -477,7 +488,7 @@ QUERY_STOPWORDS = {
     "как",
     "к",
     "фильтр",
-}
+})
 RU_EQUIV_TRANSLATION = str.maketrans({"ё": "е", "й": "и"})
 
 RU_TO_LATIN = {
@@ -517,18 +528,53 @@ RU_TO_LATIN = {
 }
 
 
+# RU_TO_LATIN already folds ё/й onto the same Latin letters as е/и, so a single
+# translate pass covers both RU_EQUIV_TRANSLATION and transliteration.
+RU_TO_LATIN_TABLE = str.maketrans(RU_TO_LATIN)
+
+
+def _expand_equivalent_spellings(overrides: Dict[str, str]) -> Dict[str, str]:
+    """Map every ё/й spelling of an already folded override key to its value.
+
+    The post-cleanup override lookup used to run on RU_EQUIV_TRANSLATION output;
+    expanding the keys keeps those matches without folding every token first.
+    """
+
+    expanded: Dict[str, str] = {}
+    for key, value in overrides.items():
+        if key.translate(RU_EQUIV_TRANSLATION) != key:
+            continue
+        variants = [""]
+        for ch in key:
+            options = {"е": "её", "и": "ий"}.get(ch, ch)
+            variants = [prefix + option for prefix in variants for option in options]
+        for variant in variants:
+            expanded[variant] = value
+    return expanded
+
+
+# Exact override keys win over their folded ё/й spellings.
+PRE_TRANSLIT_LOOKUP = {
+    **_expand_equivalent_spellings(PRE_TRANSLIT_OVERRIDES),
+    **PRE_TRANSLIT_OVERRIDES,
+}
+
+
 def _transliterate_to_latin(text: str) -> str:
-    return "".join(RU_TO_LATIN.get(ch, ch) for ch in text)
+    # str.isascii() is a flag check, so Latin tokens skip the per-char table walk.
+    if text.isascii():
+        return text
+    return text.translate(RU_TO_LATIN_TABLE)
 
 
-@dataclass
+@dataclass(slots=True)
 class Brand:
     id: str
     labels: set[str] = field(default_factory=set)
     tokens: set[str] = field(default_factory=set)
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelCandidate:
     text: str
     tokens: List[str]
@@ -538,21 +584,42 @@ class LabelCandidate:
     hyphenated: bool
 
 
-@dataclass
-class TokenStats:
-    occurrences: int = 0
-    solo_occurrences: int = 0
-    uppercase_occurrences: int = 0
-    latin_occurrences: int = 0
-    cyrillic_occurrences: int = 0
-    hyphen_occurrences: int = 0
+@dataclass(slots=True)
+class TokenColumnStats:
+    """Label statistics for every token, stored column-wise.
+
+    Each field counts occurrences per token, so a whole candidate's tokens are
+    recorded with a handful of ``Counter.update`` calls instead of per-token
+    attribute writes.
+    """
+
+    occurrences: Counter[str] = field(default_factory=Counter)
+    solo_occurrences: Counter[str] = field(default_factory=Counter)
+    uppercase_occurrences: Counter[str] = field(default_factory=Counter)
+    latin_occurrences: Counter[str] = field(default_factory=Counter)
+    cyrillic_occurrences: Counter[str] = field(default_factory=Counter)
+    hyphen_occurrences: Counter[str] = field(default_factory=Counter)
+
+    def record(self, candidate: LabelCandidate) -> None:
+        tokens = candidate.tokens
+        self.occurrences.update(tokens)
+        if candidate.token_count == 1:
+            self.solo_occurrences.update(tokens)
+        if candidate.is_upper:
+            self.uppercase_occurrences.update(tokens)
+        if candidate.has_latin:
+            self.latin_occurrences.update(tokens)
+        else:
+            self.cyrillic_occurrences.update(tokens)
+        if candidate.hyphenated:
+            self.hyphen_occurrences.update(tokens)
 
-    def score(self) -> float:
+    def score(self, token: str) -> float:
         return (
-            self.solo_occurrences * 2
-            + self.uppercase_occurrences
-            + self.hyphen_occurrences
-            + self.latin_occurrences * 0.5
+            self.solo_occurrences.get(token, 0) * 2
+            + self.uppercase_occurrences.get(token, 0)
+            + self.hyphen_occurrences.get(token, 0)
+            + self.latin_occurrences.get(token, 0) * 0.5
         )
 
 
@@ -564,107 +631,146 @@ def normalize_brand_token(raw: str | None) -> str:
     """Normalize a brand token to lowercase latin characters."""
     if not raw:
         return ""
-    text = raw.strip().lower()
-    text = text.strip("-_.,")
-    if not text:
-        return ""
-    override = PRE_TRANSLIT_OVERRIDES.get(text)
-    if override:
-        return override
-    text = text.translate(RU_EQUIV_TRANSLATION)
-    text = re.sub(r"[\"'`~!@#$%^&*+=\\[\\]{}:;,.?<>№]", " ", text)
-    text = re.sub(r"\s+", " ", text)
-    text = text.strip("-_ ")
-    if not text:
-        return ""
-    override = PRE_TRANSLIT_OVERRIDES.get(text)
+    return _normalize_brand_token_cached(raw)
+
+
+@lru_cache(maxsize=65536)
+def _normalize_brand_token_cached(raw: str) -> str:
+    # Catalog lines and queries repeat the same raw tokens thousands of times,
+    # so the full regex/transliteration pipeline is memoized per raw string.
+    text = raw.lower()
+    # Tokenizer output is already alphanumeric, so both regex passes are
+    # skipped whenever they could not change anything.
+    if not text.isalnum():
+        text = PUNCTUATION_WS_PATTERN.sub(" ", text).strip("-_ ")
+        if not text:
+            return ""
+    override = PRE_TRANSLIT_LOOKUP.get(text)
     if override:
         return override
-    transliterated = _transliterate_to_latin(text)
-    token = re.sub(r"[^0-9a-z]+", "", transliterated)
+    token = _transliterate_to_latin(text)
+    if not (token.isascii() and token.isalnum()):
+        token = NON_ALNUM_PATTERN.sub("", token)
     if not token:
         return ""
     token = POST_TRANSLIT_OVERRIDES.get(token, token)
-    return token
+    # Interned tokens make the many dict/set probes downstream compare by identity.
+    return sys.intern(token)
 
 
+@lru_cache(maxsize=16384)
 def _strip_generic_suffix(token: str) -> str:
     if not token:
         return ""
     base = token
-    changed = True
-    while changed:
-        changed = False
-        for suffix in GENERIC_SUFFIXES:
-            if base.endswith(suffix) and len(base) - len(suffix) >= 4:
-                base = base[: -len(suffix)]
-                changed = True
+    while len(base) > 4:
+        for size in _suffix_sizes_for_tail(base[-4:]):
+            if len(base) - size >= 4:
+                base = base[:-size]
                 break
-    return base
+        else:
+            break
+    return sys.intern(base)
 
 
-def _build_generic_label_tokens(words: Iterable[str]) -> set[str]:
-    tokens: set[str] = set()
-    for word in words:
-        normalized = normalize_brand_token(word)
-        if not normalized:
-            continue
-        tokens.add(normalized)
-        tokens.add(_strip_generic_suffix(normalized))
-    return {token for token in tokens if token}
+@lru_cache(maxsize=4096)
+def _suffix_sizes_for_tail(tail: str) -> Tuple[int, ...]:
+    """Lengths of the generic suffixes ending ``tail``, in GENERIC_SUFFIXES order.
+
+    No suffix is longer than four characters, so the last four characters of a
+    token decide every candidate for one stripping step.
+    """
+
+    return tuple(len(suffix) for suffix in GENERIC_SUFFIXES if tail.endswith(suffix))
+
+
+def _build_generic_label_tokens(words: Iterable[str]) -> frozenset[str]:
+    normalized = {normalize_brand_token(word) for word in words}
+    return frozenset(
+        token for item in normalized for token in (item, _strip_generic_suffix(item)) if token
+    )
 
 
 GENERIC_LABEL_TOKENS = _build_generic_label_tokens(GENERIC_LABEL_WORDS)
-GENERIC_TOKEN_BASES = {
+GENERIC_TOKEN_BASES = frozenset(
     token for token in (_strip_generic_suffix(item) for item in GENERIC_LABEL_TOKENS) if token
-}
+)
 
 
+@lru_cache(maxsize=16384)
 def _is_generic_like_token(token: str) -> bool:
-    if not token:
-        return True
-    if token in GENERIC_LABEL_TOKENS:
-        return True
-    base = _strip_generic_suffix(token)
-    if base in GENERIC_TOKEN_BASES:
-        return True
-    return False
+    return (
+        not token
+        or token in GENERIC_LABEL_TOKENS
+        or _strip_generic_suffix(token) in GENERIC_TOKEN_BASES
+    )
 
 
 def load_manufacturers(path: str | Path = MANUFACTURER_FILE) -> List[str]:
     file_path = ensure_data_file(path, settings.manufacturers_source_url or None)
     lines: List[str] = []
-    with file_path.open("r", encoding="utf-8", errors="ignore") as handle:
-        for raw_line in handle:
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            lines.append(line)
+    with file_path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return lines
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for chunk in iter(mapped.readline, b""):
+                # splitlines() also breaks on bare "\r", like text-mode reads.
+                for raw_line in chunk.splitlines():
+                    # Blank and comment lines are dropped before paying for decoding.
+                    raw_line = raw_line.strip()
+                    if not raw_line or raw_line.startswith(b"#"):
+                        continue
+                    line = raw_line.decode("utf-8", errors="ignore").strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    lines.append(line)
     return lines
 
 
 def _tokenize_text(text: str) -> List[str]:
-    return TOKEN_PATTERN.findall(text or "")
-
-
-def _looks_all_caps(text: str) -> bool:
-    letters = [ch for ch in text if ch.isalpha()]
-    if not letters:
-        return False
-    return all(ch.isupper() for ch in letters)
-
-
-def _contains_latin(text: str) -> bool:
-    return bool(re.search(r"[A-Za-z]", text))
-
-
+    text = text or ""
+    if text.isascii():
+        # ASCII input: blank out every non-alphanumeric byte and split, which
+        # yields exactly TOKEN_PATTERN's runs without entering the regex engine.
+        return text.encode("ascii").translate(ASCII_TOKEN_DELIMITERS).decode("ascii").split()
+    return TOKEN_PATTERN.findall(text)
+
+
+def _scan_segment(text: str) -> Tuple[bool, bool, bool]:
+    """Return ``(is_upper, has_latin, hyphenated)`` for a label segment in one pass.
+
+    ``is_upper`` requires at least one letter and every letter uppercase;
+    ``has_latin`` means any ASCII letter is present.
+    """
+
+    has_letters = False
+    all_upper = True
+    has_latin = False
+    hyphenated = False
+    for ch in text:
+        if ch == "-":
+            hyphenated = True
+        elif ch.isalpha():
+            has_letters = True
+            if not ch.isupper():
+                all_upper = False
+            if ch.isascii():
+                has_latin = True
+    return has_letters and all_upper, has_latin, hyphenated
+
+
+@lru_cache(maxsize=16384)
 def _looks_like_article_code(token: str) -> bool:
-    if not token:
+    # Every ARTICLE_CODE_PATTERN branch and the digit-ratio rule need a digit,
+    # so short and purely alphabetic tokens (most brand words) bail out early.
+    if len(token) < 3 or token.isalpha():
+        return False
+    digits = sum(map(str.isdigit, token))
+    if not digits:
         return False
     if ARTICLE_CODE_PATTERN.match(token):
         return True
-    letters = sum(1 for ch in token if ch.isalpha())
-    digits = sum(1 for ch in token if ch.isdigit())
+    letters = sum(map(str.isalpha, token))
     return digits >= 3 and digits >= letters
 
 
@@ -682,18 +788,19 @@ def _is_noise_line(line: str) -> bool:
     if first_token in NOISE_STARTERS:
         return True
     # If digits dominate the string (article descriptions), treat as noise.
-    digits = sum(1 for ch in stripped if ch.isdigit())
-    letters = sum(1 for ch in stripped if ch.isalpha())
-    return digits > 0 and digits >= letters * 2
+    digits = sum(map(str.isdigit, stripped))
+    if not digits:
+        return False
+    return digits >= sum(map(str.isalpha, stripped)) * 2
 
 
 def _split_segments(line: str) -> Iterable[str]:
-    for segment in re.split(r"[,/|()]+", line):
+    for segment in SEGMENT_SPLIT_PATTERN.split(line):
         part = segment.strip()
         if not part:
             continue
         if _should_split_hyphen(part):
-            for sub in re.split(r"-+", part):
+            for sub in HYPHEN_SPLIT_PATTERN.split(part):
                 sub = sub.strip()
                 if sub:
                     yield sub
@@ -732,76 +839,174 @@ def _tokens_from_label(label: str) -> List[str]:
     return tokens
 
 
-def _damerau_levenshtein(a: str, b: str) -> int:
-    if a == b:
-        return 0
-    if not a:
-        return len(b)
-    if not b:
-        return len(a)
-    len_a = len(a)
-    len_b = len(b)
-    dist = [[0] * (len_b + 1) for _ in range(len_a + 1)]
-    for i in range(len_a + 1):
-        dist[i][0] = i
-    for j in range(len_b + 1):
-        dist[0][j] = j
-    for i in range(1, len_a + 1):
-        for j in range(1, len_b + 1):
-            cost = 0 if a[i - 1] == b[j - 1] else 1
-            dist[i][j] = min(
-                dist[i - 1][j] + 1,
-                dist[i][j - 1] + 1,
-                dist[i - 1][j - 1] + cost,
-            )
-            if (
-                i > 1
-                and j > 1
-                and a[i - 1] == b[j - 2]
-                and a[i - 2] == b[j - 1]
-            ):
-                dist[i][j] = min(dist[i][j], dist[i - 2][j - 2] + cost)
-    return dist[len_a][len_b]
+MAX_FUZZY_EDITS = 3
+FUZZY_CACHE_SIZE = 16384
+
+
+class _TrieNode:
+    __slots__ = ("children", "brand", "order")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _TrieNode] = {}
+        self.brand: str | None = None
+        self.order = -1
+
+
+class BrandTrie:
+    """Character trie over brand tokens used for bounded fuzzy lookups.
+
+    Each terminal node remembers the insertion order of its token so ties are
+    resolved exactly like a scan over the original ``token -> brand`` mapping.
+    """
+
+    def __init__(self, brand_lookup: Dict[str, str]) -> None:
+        self.root = _TrieNode()
+        self._cache: Dict[str, str | None] = {}
+        for order, (token, brand) in enumerate(brand_lookup.items()):
+            node = self.root
+            for ch in token:
+                child = node.children.get(ch)
+                if child is None:
+                    child = node.children[ch] = _TrieNode()
+                node = child
+            node.brand = brand
+            node.order = order
+
+    def _attachment_match(self, token: str) -> Tuple[int, str] | None:
+        """Find exact hits and obvious prefix/suffix attachments.
+
+        Covers "toyotamotor" (brand token plus up to 8 trailing letters) and
+        truncated inputs whose brand token adds up to 4 letters.
+        """
+
+        best: Tuple[int, str] | None = None
+        node = self.root
+        for depth, ch in enumerate(token, start=1):
+            node = node.children.get(ch)
+            if node is None:
+                return best
+            if node.brand is None:
+                continue
+            suffix = token[depth:]
+            if not suffix or (depth >= 4 and len(suffix) <= 8 and suffix.isalpha()):
+                if best is None or node.order < best[0]:
+                    best = (node.order, node.brand)
+        stack = [(child, 1) for ch, child in node.children.items() if ch.isalpha()]
+        while stack:
+            current, extra = stack.pop()
+            if current.brand is not None and (best is None or current.order < best[0]):
+                best = (current.order, current.brand)
+            if extra < 4:
+                stack.extend(
+                    (child, extra + 1) for ch, child in current.children.items() if ch.isalpha()
+                )
+        return best
+
+    def _distance_match(self, token: str) -> str | None:
+        """Return the closest brand by optimal-string-alignment distance.
+
+        The DP row for each trie prefix is shared by every token below it and a
+        subtree is pruned once its row minimum exceeds ``MAX_FUZZY_EDITS``.
+        """
+
+        first = self.root.children.get(token[0])
+        if first is None:
+            return None
+        token_len = len(token)
+        best_score = 0.0
+        best_order = -1
+        best_brand: str | None = None
+        initial = list(range(token_len + 1))
+        stack = [(first, token[0], 1, self._next_row(initial, None, "", token[0], 1, token), initial)]
+        while stack:
+            node, ch, depth, row, prev_row = stack.pop()
+            if node.brand is not None and depth >= 4:
+                distance = row[token_len]
+                max_len = max(depth, token_len)
+                if distance <= MAX_FUZZY_EDITS and distance <= max(1, max_len // 3):
+                    score = 1 - distance / max_len
+                    if score >= 0.6 and (
+                        score > best_score or (score == best_score and node.order < best_order)
+                    ):
+                        best_score = score
+                        best_order = node.order
+                        best_brand = node.brand
+            # Distance is at least the length difference, so deeper tokens can
+            # never come back under the edit budget.
+            if depth >= token_len + MAX_FUZZY_EDITS:
+                continue
+            for next_ch, child in node.children.items():
+                next_row = self._next_row(row, prev_row, ch, next_ch, depth + 1, token)
+                if min(next_row) <= MAX_FUZZY_EDITS:
+                    stack.append((child, next_ch, depth + 1, next_row, row))
+        return best_brand
+
+    @staticmethod
+    def _next_row(
+        row: List[int],
+        prev_row: List[int] | None,
+        ch: str,
+        next_ch: str,
+        depth: int,
+        token: str,
+    ) -> List[int]:
+        """Extend the DP matrix by one candidate character (OSA recurrence).
+
+        Cells further than ``MAX_FUZZY_EDITS`` from the diagonal can never be
+        within budget, so only the band around it is computed and everything
+        outside is capped at ``MAX_FUZZY_EDITS + 1``.
+        """
+
+        cap = MAX_FUZZY_EDITS + 1
+        token_len = len(token)
+        next_row = [cap] * (token_len + 1)
+        next_row[0] = min(depth, cap)
+        for j in range(max(1, depth - MAX_FUZZY_EDITS), min(token_len, depth + MAX_FUZZY_EDITS) + 1):
+            token_ch = token[j - 1]
+            cost = 0 if token_ch == next_ch else 1
+            value = min(next_row[j - 1] + 1, row[j] + 1, row[j - 1] + cost)
+            if prev_row is not None and j > 1 and token_ch == ch and token[j - 2] == next_ch:
+                value = min(value, prev_row[j - 2] + cost)
+            next_row[j] = value
+        return next_row
+
+    def lookup(self, token: str) -> str | None:
+        if len(token) < 4:
+            return None
+        # Misspelled query tokens repeat, and the trie is rebuilt whenever the
+        # lookup map changes, so results are memoized per instance.
+        if token in self._cache:
+            return self._cache[token]
+        attached = self._attachment_match(token)
+        brand = attached[1] if attached is not None else self._distance_match(token)
+        if len(self._cache) >= FUZZY_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[token] = brand
+        return brand
+
+
+_brand_trie: BrandTrie | None = None
+_brand_trie_source: Dict[str, str] | None = None
+
+
+def _get_brand_trie(brand_lookup: Dict[str, str]) -> BrandTrie:
+    global _brand_trie
+    global _brand_trie_source
+    if _brand_trie is None or _brand_trie_source is not brand_lookup:
+        _brand_trie = BrandTrie(brand_lookup)
+        _brand_trie_source = brand_lookup
+    return _brand_trie
 
 
 def _fuzzy_brand_lookup(token: str, brand_lookup: Dict[str, str]) -> str | None:
-    if len(token) < 4:
+    if len(token) < 4 or not brand_lookup:
         return None
-    best_brand: str | None = None
-    best_score = 0.0
-    for candidate, brand in brand_lookup.items():
-        if candidate == token:
-            return brand
-        # Handle obvious prefix/suffix attachments ("toyotamotor", "камазовские")
-        # before falling back to the slower distance computation.
-        if len(candidate) >= 4 and token.startswith(candidate):
-            suffix = token[len(candidate) :]
-            if suffix and len(suffix) <= 8 and suffix.isalpha():
-                return brand
-        if len(token) >= 4 and candidate.startswith(token):
-            prefix = candidate[len(token) :]
-            if prefix and len(prefix) <= 4 and prefix.isalpha():
-                return brand
-        if len(candidate) < 4:
-            continue
-        if candidate[0] != token[0]:
-            continue
-        if abs(len(candidate) - len(token)) > max(4, len(candidate) // 2):
-            continue
-        distance = _damerau_levenshtein(token, candidate)
-        max_len = max(len(candidate), len(token))
-        if distance > 3 or distance > max(1, max_len // 3):
-            continue
-        score = 1 - distance / max_len
-        if score >= 0.6 and score > best_score:
-            best_score = score
-            best_brand = brand
-    return best_brand
+    return _get_brand_trie(brand_lookup).lookup(token)
 
 
-def _collect_candidates(lines: Sequence[str]) -> Tuple[List[LabelCandidate], Dict[str, TokenStats]]:
+def _collect_candidates(lines: Sequence[str]) -> Tuple[List[LabelCandidate], TokenColumnStats]:
     candidates: List[LabelCandidate] = []
-    stats: Dict[str, TokenStats] = defaultdict(TokenStats)
+    stats = TokenColumnStats()
     for line in lines:
         if _is_noise_line(line):
             continue
@@ -809,57 +1014,54 @@ def _collect_candidates(lines: Sequence[str]) -> Tuple[List[LabelCandidate], Dic
             tokens = _tokens_from_label(segment)
             if not tokens:
                 continue
+            is_upper, has_latin, hyphenated = _scan_segment(segment)
             candidate = LabelCandidate(
                 text=segment.strip(),
                 tokens=tokens,
-                is_upper=_looks_all_caps(segment),
-                has_latin=_contains_latin(segment),
+                is_upper=is_upper,
+                has_latin=has_latin,
                 token_count=len(tokens),
-                hyphenated="-" in segment,
+                hyphenated=hyphenated,
             )
             candidates.append(candidate)
-            for token in tokens:
-                stat = stats[token]
-                stat.occurrences += 1
-                if candidate.token_count == 1:
-                    stat.solo_occurrences += 1
-                if candidate.is_upper:
-                    stat.uppercase_occurrences += 1
-                if candidate.has_latin:
-                    stat.latin_occurrences += 1
-                else:
-                    stat.cyrillic_occurrences += 1
-                if candidate.hyphenated:
-                    stat.hyphen_occurrences += 1
+            stats.record(candidate)
     return candidates, stats
 
 
-def _select_trusted_tokens(stats: Dict[str, TokenStats]) -> set[str]:
+def _select_trusted_tokens(stats: TokenColumnStats) -> set[str]:
     trusted: set[str] = set()
-    for token, stat in stats.items():
+    solo_counts = stats.solo_occurrences
+    uppercase_counts = stats.uppercase_occurrences
+    latin_counts = stats.latin_occurrences
+    cyrillic_counts = stats.cyrillic_occurrences
+    hyphen_counts = stats.hyphen_occurrences
+    for token, occurrences in stats.occurrences.items():
         if not token:
             continue
         if _is_generic_like_token(token):
             continue
-        if stat.cyrillic_occurrences and not stat.latin_occurrences and stat.uppercase_occurrences == 0:
+        solo = solo_counts.get(token, 0)
+        uppercase = uppercase_counts.get(token, 0)
+        latin = latin_counts.get(token, 0)
+        if cyrillic_counts.get(token, 0) and not latin and uppercase == 0:
             continue
-        latin_heavy = stat.latin_occurrences > 0
-        uppercase_heavy = stat.uppercase_occurrences > 0
-        hyphen_support = stat.hyphen_occurrences > 0
-        if latin_heavy and (stat.solo_occurrences or hyphen_support or stat.occurrences >= 2):
+        latin_heavy = latin > 0
+        uppercase_heavy = uppercase > 0
+        hyphen_support = hyphen_counts.get(token, 0) > 0
+        if latin_heavy and (solo or hyphen_support or occurrences >= 2):
             trusted.add(token)
             continue
         if not latin_heavy:
-            if uppercase_heavy and stat.solo_occurrences:
+            if uppercase_heavy and solo:
                 trusted.add(token)
                 continue
-            if stat.uppercase_occurrences >= 2 and stat.occurrences >= 2:
+            if uppercase >= 2 and occurrences >= 2:
                 trusted.add(token)
                 continue
-        if hyphen_support and stat.occurrences >= 2:
+        if hyphen_support and occurrences >= 2:
             trusted.add(token)
             continue
-        if stat.score() >= 3.0:
+        if stats.score(token) >= 3.0:
             trusted.add(token)
     return trusted
 
@@ -873,15 +1075,21 @@ def _register_candidate(
     canonical = next((token for token in candidate.tokens if token in trusted_tokens), None)
     if not canonical:
         return
-    brand = brands.setdefault(canonical, Brand(id=canonical))
+    # Explicit membership tests avoid building a throwaway Brand (and its two
+    # sets) on every repeated label.
+    brand = brands.get(canonical)
+    if brand is None:
+        brand = brands[canonical] = Brand(id=canonical)
     brand.labels.add(candidate.text)
     for token in candidate.tokens:
         if token not in trusted_tokens:
             continue
         brand.tokens.add(token)
-        token_map.setdefault(token, canonical)
+        if token not in token_map:
+            token_map[token] = canonical
     brand.tokens.add(canonical)
-    token_map.setdefault(canonical, canonical)
+    if canonical not in token_map:
+        token_map[canonical] = canonical
 
 
 def build_brand_catalog(lines: Sequence[str]) -> Tuple[Dict[str, Brand], Dict[str, str]]:
@@ -903,6 +1111,9 @@ def init_brands(path: str | Path = MANUFACTURER_FILE) -> Dict[str, Brand]:
     catalog, token_map = build_brand_catalog(lines)
     _brand_catalog = catalog
     _brand_by_token = token_map
+    _get_brand_trie(token_map)
+    _extract_brand_ids_cached.cache_clear()
+    _detect_brands_cached.cache_clear()
     logger.info(
         "Initialized brand catalog with %s canonical brands and %s tokens",
         len(_brand_catalog),
@@ -928,50 +1139,81 @@ def get_normalized_brand_ids() -> List[str]:
     return sorted(get_brand_catalog().keys())
 
 
-def extract_brand_ids_from_text(text: str, brand_map: Dict[str, str] | None = None) -> List[str]:
-    brand_lookup = brand_map or get_brand_token_map()
-    tokens = _tokenize_text(text or "")
-    detected: List[str] = []
-    seen = set()
-    for token in tokens:
+def _resolve_brand_tokens(
+    text: str, brand_lookup: Dict[str, str]
+) -> Iterator[Tuple[str, str, bool, str | None]]:
+    """Yield ``(raw, normalized, is_generic, brand)`` for every token in one pass.
+
+    Exact token hits are plain dict lookups; only the misses fall back to the
+    fuzzy trie walk.
+    """
+
+    for token in _tokenize_text(text or ""):
         normalized = normalize_brand_token(token)
         if not normalized:
             continue
         if _is_generic_like_token(normalized):
+            yield token, normalized, True, None
             continue
         brand = brand_lookup.get(normalized)
         if not brand:
             brand = _fuzzy_brand_lookup(normalized, brand_lookup)
+        yield token, normalized, False, brand
+
+
+def extract_brand_ids_from_text(text: str, brand_map: Dict[str, str] | None = None) -> List[str]:
+    if not brand_map:
+        return list(_extract_brand_ids_cached(text or ""))
+    return _extract_brand_ids(text, brand_map)
+
+
+def _extract_brand_ids(text: str, brand_lookup: Dict[str, str]) -> List[str]:
+    detected: List[str] = []
+    seen = set()
+    for _, _, _, brand in _resolve_brand_tokens(text, brand_lookup):
         if brand and brand not in seen:
             seen.add(brand)
             detected.append(brand)
     return detected
 
 
+@lru_cache(maxsize=4096)
+def _extract_brand_ids_cached(text: str) -> Tuple[str, ...]:
+    return tuple(_extract_brand_ids(text, get_brand_token_map()))
+
+
 def detect_brands_in_query(
     raw_query: str,
     brand_map: Dict[str, str] | None = None,
 ) -> Tuple[List[str], List[str], List[str], List[str]]:
-    """Return detected brand ids plus normalized and raw non-brand tokens."""
+    """Return detected brand ids plus normalized and raw non-brand tokens.
+
+    Lookups against the global catalog are memoized per raw query; the cache
+    holds tuples and every call gets fresh lists.
+    """
+
+    if not brand_map:
+        brands, non_brand_terms, raw_non_brand_terms, brand_raw_tokens = _detect_brands_cached(
+            raw_query or ""
+        )
+        return list(brands), list(non_brand_terms), list(raw_non_brand_terms), list(brand_raw_tokens)
+    return _detect_brands(raw_query, brand_map)
+
 
-    brand_lookup = brand_map or get_brand_token_map()
-    tokens = _tokenize_text(raw_query or "")
+def _detect_brands(
+    raw_query: str,
+    brand_lookup: Dict[str, str],
+) -> Tuple[List[str], List[str], List[str], List[str]]:
     brands: List[str] = []
     non_brand_terms: List[str] = []
     raw_non_brand_terms: List[str] = []
     brand_raw_tokens: List[str] = []
     seen = set()
-    for token in tokens:
-        normalized = normalize_brand_token(token)
-        if not normalized:
-            continue
-        if _is_generic_like_token(normalized):
+    for token, normalized, is_generic, brand in _resolve_brand_tokens(raw_query, brand_lookup):
+        if is_generic:
             non_brand_terms.append(normalized)
             raw_non_brand_terms.append(token)
             continue
-        brand = brand_lookup.get(normalized)
-        if not brand:
-            brand = _fuzzy_brand_lookup(normalized, brand_lookup)
         if brand:
             brand_raw_tokens.append(token)
             if brand not in seen:
@@ -983,3 +1225,13 @@ def detect_brands_in_query(
         non_brand_terms.append(normalized)
         raw_non_brand_terms.append(token)
     return brands, non_brand_terms, raw_non_brand_terms, brand_raw_tokens
+
+
+@lru_cache(maxsize=4096)
+def _detect_brands_cached(
+    raw_query: str,
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    brands, non_brand_terms, raw_non_brand_terms, brand_raw_tokens = _detect_brands(
+        raw_query, get_brand_token_map()
+    )
+    return tuple(brands), tuple(non_brand_terms), tuple(raw_non_brand_terms), tuple(brand_raw_tokens)
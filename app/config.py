@@ -10,16 +10,35 @@ def _get_env(name: str, default: str) -> str:
     return value if value is not None else default
 
 
-@dataclass(frozen=True)
+def _get_env_int(name: str, default: int) -> int:
+    return int(_get_env(name, str(default)))
+
+
+def _get_env_bool(name: str, default: bool) -> bool:
+    return _get_env(name, "true" if default else "false").lower() in {"1", "true", "yes"}
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Simple settings container with environment variable overrides."""
+    """Simple settings container with environment variable overrides.
+
+    Defaults are read from the environment once, when the class body runs.
+    """
 
     es_host: str = _get_env("ES_HOST", "http://localhost:9200")
     es_index: str = _get_env("ES_INDEX", "products")
     mapping_path: str = _get_env("MAPPING_PATH", "product-mapping.json")
     synonyms_path: str = _get_env("SYNONYMS_PATH", "config/brand_synonyms.txt")
     offers_path: str = _get_env("OFFERS_PATH", "offers.json")
-    load_on_startup: bool = _get_env("LOAD_ON_STARTUP", "true").lower() in {"1", "true", "yes"}
+    offers_source_url: str = _get_env("OFFERS_SOURCE_URL", "")
+    manufacturers_source_url: str = _get_env("MANUFACTURERS_SOURCE_URL", "")
+    prepare_workers: int = _get_env_int("PREPARE_WORKERS", 1)
+    bulk_thread_count: int = _get_env_int("BULK_THREAD_COUNT", os.cpu_count() or 4)
+    bulk_chunk_size: int = _get_env_int("BULK_CHUNK_SIZE", 1000)
+    bulk_max_chunk_bytes: int = _get_env_int("BULK_MAX_CHUNK_BYTES", 10 * 1024 * 1024)
+    bulk_queue_size: int = _get_env_int("BULK_QUEUE_SIZE", 4)
+    warmup_queries_path: str = _get_env("WARMUP_QUERIES_PATH", "")
+    load_on_startup: bool = _get_env_bool("LOAD_ON_STARTUP", True)
     log_level: str = _get_env("LOG_LEVEL", "INFO")
 
 
@@ -9,6 +9,8 @@ from urllib.request import urlopen
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
 
 def ensure_data_file(path: str | Path, source_url: str | None = None) -> Path:
     """Ensure a data file exists locally, downloading it when a URL is provided."""
@@ -23,7 +25,7 @@ def ensure_data_file(path: str | Path, source_url: str | None = None) -> Path:
     file_path.parent.mkdir(parents=True, exist_ok=True)
     try:
         with urlopen(source_url) as response, file_path.open("wb") as handle:
-            shutil.copyfileobj(response, handle)
+            shutil.copyfileobj(response, handle, DOWNLOAD_BUFFER_SIZE)
     except (OSError, URLError) as exc:
         raise RuntimeError(f"Failed to download {source_url} -> {file_path}") from exc
     return file_path
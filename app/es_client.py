@@ -1,21 +1,54 @@
-"""Elasticsearch client factory.
+"""Elasticsearch client factories.
 
-The rest of the code works against the official synchronous client. Blocking
-calls are wrapped via ``asyncio.to_thread`` by the caller where necessary.
+Request handlers use the native asyncio client so searches, health checks and
+index maintenance run on the event loop. Bulk imports keep the synchronous
+client: ``helpers.parallel_bulk`` fans chunks out over worker threads, which
+the importer runs via ``asyncio.to_thread``.
 """
 from __future__ import annotations
 
 import logging
 from functools import lru_cache
 
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch, Elasticsearch
+from elasticsearch.serializer import OrjsonSerializer
 
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Pooled connections per node even with few bulk threads; also the CLI's
+# default batch window, so concurrent searches never queue in the transport.
+MIN_CONNECTIONS_PER_NODE = 32
+
+
+def _client_options() -> dict:
+    return {
+        "serializer": OrjsonSerializer(),
+        # One pooled connection per bulk thread plus headroom for searches.
+        "connections_per_node": max(settings.bulk_thread_count * 2, MIN_CONNECTIONS_PER_NODE),
+        "http_compress": True,
+        "request_timeout": 60,
+        "retry_on_timeout": True,
+        "max_retries": 3,
+    }
+
 
 @lru_cache(maxsize=1)
 def get_client() -> Elasticsearch:
     logger.info("Connecting to Elasticsearch at %s", settings.es_host)
-    return Elasticsearch(settings.es_host)
+    return Elasticsearch(settings.es_host, **_client_options())
+
+
+@lru_cache(maxsize=1)
+def get_async_client() -> AsyncElasticsearch:
+    logger.info("Connecting async client to Elasticsearch at %s", settings.es_host)
+    # httpx is already a dependency, so it backs the async transport.
+    return AsyncElasticsearch(settings.es_host, node_class="httpxasync", **_client_options())
+
+
+async def close_async_client() -> None:
+    """Close the shared async client so the next caller gets a fresh one."""
+
+    await get_async_client().close()
+    get_async_client.cache_clear()
@@ -2,14 +2,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import batched
 from pathlib import Path
 from typing import Iterable
 
-from elasticsearch import Elasticsearch, helpers
+import orjson
+from elasticsearch import AsyncElasticsearch, Elasticsearch, helpers
 
 from .config import settings
+from .es_client import get_client
 from .phonetics import normalize_query, to_phonetic, transliterate_text
 
 logger = logging.getLogger(__name__)
@@ -19,14 +24,12 @@ def _load_offers(path: Path) -> list[dict]:
     if not path.exists():
         logger.warning("Offers file %s is missing", path)
         return []
+    data = path.read_bytes()
     # Detect Git LFS placeholder to avoid attempting to parse it as JSON.
-    with path.open("r", encoding="utf-8") as fh:
-        first_line = fh.readline()
-        if first_line.startswith("version https://git-lfs.github.com/spec/v1"):
-            logger.warning("Offers file %s is a Git LFS pointer; real data not downloaded", path)
-            return []
-        fh.seek(0)
-        return json.load(fh)
+    if data.startswith(b"version https://git-lfs.github.com/spec/v1"):
+        logger.warning("Offers file %s is a Git LFS pointer; real data not downloaded", path)
+        return []
+    return orjson.loads(data)
 
 
 def _prepare_product(raw: dict) -> dict:
@@ -35,10 +38,12 @@ def _prepare_product(raw: dict) -> dict:
     product_code = raw.get("productCode") or raw.get("product_code") or raw.get("article") or ""
     external_id = str(raw.get("externalId") or raw.get("external_id") or raw.get("id") or product_code or title)
 
-    phonetic_source = " ".join(part for part in (title, manufacturer) if part)
     normalized_title = normalize_query(title)
-    normalized_phonetic_source = normalize_query(phonetic_source)
-    phonetic = to_phonetic(normalized_phonetic_source)
+    # Multi-word brand aliases ("range" + "rover") can span the title and the
+    # manufacturer, so the phonetic source is normalized as one string. Without
+    # a manufacturer it is the bare title, which normalize_query's cache holds.
+    phonetic_source = " ".join(part for part in (title, manufacturer) if part)
+    phonetic = to_phonetic(normalize_query(phonetic_source))
     transliterated_title = transliterate_text(title)
     title_phonetic = to_phonetic(normalized_title)
 
@@ -58,35 +63,118 @@ def _prepare_product(raw: dict) -> dict:
     return product
 
 
-def _iter_actions(index: str, products: Iterable[dict]) -> Iterable[dict]:
-    for product in products:
-        yield {
-            "_index": index,
-            "_id": product.get("externalId") or product.get("productCode"),
-            "_source": product,
-        }
+def _iter_actions(products: Iterable[dict]) -> Iterable[tuple[dict, dict]]:
+    """Yield ready ``(action, source)`` pairs; the target index is set per request."""
 
+    for product in products:
+        yield {"index": {"_id": product.get("externalId") or product.get("productCode")}}, product
+
+
+def _prebuilt_action(item: tuple[dict, dict]) -> tuple[dict, dict]:
+    return item
+
+
+def _bulk_index(es: Elasticsearch, index: str, actions: Iterable[tuple[dict, dict]]) -> int:
+    """Send actions through ``parallel_bulk`` and return how many were indexed.
+
+    Periodic refreshes are switched off for the duration of the load and the
+    index default is restored (followed by one explicit refresh) afterwards,
+    even if the load fails.
+    """
+
+    es.indices.put_settings(index=index, settings={"index": {"refresh_interval": "-1"}})
+    indexed = 0
+    try:
+        for ok, _ in helpers.parallel_bulk(
+            es,
+            actions,
+            thread_count=settings.bulk_thread_count,
+            chunk_size=settings.bulk_chunk_size,
+            max_chunk_bytes=settings.bulk_max_chunk_bytes,
+            queue_size=settings.bulk_queue_size,
+            expand_action_callback=_prebuilt_action,
+            raise_on_error=True,
+            index=index,
+        ):
+            indexed += ok
+    except BaseException:
+        # The cluster may be why the load failed; a failing restore must not
+        # replace the original bulk error.
+        try:
+            _restore_refresh(es, index)
+        except Exception:
+            logger.exception("Failed to restore refresh settings on index %s", index)
+        raise
+    _restore_refresh(es, index)
+    return indexed
+
+
+def _restore_refresh(es: Elasticsearch, index: str) -> None:
+    es.indices.put_settings(index=index, settings={"index": {"refresh_interval": None}})
+    es.indices.refresh(index=index)
+
+
+def _prepare_chunk(chunk: tuple[dict, ...]) -> list[dict]:
+    return [_prepare_product(item) for item in chunk]
+
+
+def _iter_prepared(pool: ProcessPoolExecutor, offers: list[dict], window: int) -> Iterable[dict]:
+    """Yield prepared products in order, keeping at most ``window`` chunks in flight.
+
+    ``Executor.map`` would submit every chunk up front and keep all results
+    alive until consumed; here a new chunk is submitted only once
+    ``parallel_bulk`` has drained an earlier one.
+    """
+
+    chunks = batched(offers, settings.bulk_chunk_size)
+    pending: deque[Future[list[dict]]] = deque()
+    for chunk in chunks:
+        pending.append(pool.submit(_prepare_chunk, chunk))
+        if len(pending) >= window:
+            break
+    while pending:
+        products = pending.popleft().result()
+        next_chunk = next(chunks, None)
+        if next_chunk is not None:
+            pending.append(pool.submit(_prepare_chunk, next_chunk))
+        yield from products
+
+
+def _index_offers(es: Elasticsearch, index: str, offers: list[dict]) -> int:
+    """Prepare offers in worker processes while the bulk threads index them."""
+
+    if settings.prepare_workers <= 1:
+        products = (_prepare_product(item) for item in offers)
+        return _bulk_index(es, index, _iter_actions(products))
+    # This runs on a worker thread of a multi-threaded server; fork() there can
+    # deadlock the children, so start workers from a clean forkserver instead.
+    with ProcessPoolExecutor(
+        max_workers=settings.prepare_workers,
+        mp_context=multiprocessing.get_context("forkserver"),
+    ) as pool:
+        products = _iter_prepared(pool, offers, window=settings.prepare_workers * 2)
+        return _bulk_index(es, index, _iter_actions(products))
+
+
+async def import_products() -> int:
+    """Bulk load the offers file on the synchronous client's worker threads."""
 
-async def import_products(es: Elasticsearch) -> int:
     offers = _load_offers(Path(settings.offers_path))
     if not offers:
         return 0
-    products = [_prepare_product(item) for item in offers]
-    actions = list(_iter_actions(settings.es_index, products))
-    await asyncio.to_thread(helpers.bulk, es, actions)
-    return len(actions)
+    return await asyncio.to_thread(_index_offers, get_client(), settings.es_index, offers)
 
 
-async def import_if_empty(es: Elasticsearch) -> int:
-    stats = await asyncio.to_thread(es.count, index=settings.es_index)
+async def import_if_empty(es: AsyncElasticsearch) -> int:
+    stats = await es.count(index=settings.es_index)
     if stats.get("count", 0) > 0:
         return 0
-    return await import_products(es)
+    return await import_products()
 
 
-async def reindex_data(es: Elasticsearch) -> int:
+async def reindex_data(es: AsyncElasticsearch) -> int:
     from .indexing import drop_index, ensure_index
 
     await drop_index(es)
     await ensure_index(es)
-    return await import_products(es)
+    return await import_products()
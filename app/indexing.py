@@ -1,12 +1,13 @@
 """Index creation and maintenance helpers."""
 from __future__ import annotations
 
-import asyncio
+import copy
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch
 from elasticsearch.exceptions import BadRequestError, NotFoundError
 
 from .config import settings
@@ -14,25 +15,58 @@ from .config import settings
 logger = logging.getLogger(__name__)
 
 
-def _load_mapping(mapping_path: Path) -> dict:
-    with mapping_path.open("r", encoding="utf-8") as fh:
+@lru_cache(maxsize=8)
+def _load_mapping_cached(path: str, mtime: float) -> dict:
+    with open(path, "r", encoding="utf-8") as fh:
         return json.load(fh)
 
 
+def _load_mapping(mapping_path: Path) -> dict:
+    """Return a private copy of the parsed mapping, re-read only when it changes."""
+
+    mapping = _load_mapping_cached(str(mapping_path), mapping_path.stat().st_mtime)
+    return copy.deepcopy(mapping)
+
+
+@lru_cache(maxsize=8)
+def _load_synonyms_cached(path: str, mtime: float) -> tuple[str, ...]:
+    with open(path, "r", encoding="utf-8") as fh:
+        text = fh.read()
+    # Text mode already folded \r\n and \r into \n, so one C-level split suffices.
+    rules = (line.strip() for line in text.split("\n"))
+    return tuple(rule for rule in rules if rule and not rule.startswith("#"))
+
+
+def mapping_replica_count() -> int:
+    """Number of replicas the mapping file creates the index with."""
+
+    mapping_path = Path(settings.mapping_path)
+    try:
+        body = _load_mapping_cached(str(mapping_path), mapping_path.stat().st_mtime)
+    except FileNotFoundError:
+        return 1  # Elasticsearch's own default
+    index_settings = body.get("settings", {})
+    replicas = index_settings.get("number_of_replicas", index_settings.get("index", {}).get("number_of_replicas", 1))
+    return int(replicas)
+
+
 def _load_synonyms(path: Path) -> list[str]:
     """Read synonym rules from a file, ignoring blanks and comments."""
 
     try:
-        with path.open("r", encoding="utf-8") as fh:
-            return [line.strip() for line in fh if line.strip() and not line.lstrip().startswith("#")]
+        return list(_load_synonyms_cached(str(path), path.stat().st_mtime))
     except FileNotFoundError:
         logger.warning("Synonyms file %s not found; falling back to mapping defaults", path)
         return []
 
 
-async def ensure_index(es: Elasticsearch) -> None:
+async def ensure_index(es: AsyncElasticsearch) -> None:
     """Create the products index with custom analyzers if it is missing."""
 
+    exists = await es.indices.exists(index=settings.es_index)
+    if exists:
+        return
+
     mapping_path = Path(settings.mapping_path)
     body = _load_mapping(mapping_path)
     brand_synonyms = _load_synonyms(Path(settings.synonyms_path))
@@ -46,12 +80,9 @@ async def ensure_index(es: Elasticsearch) -> None:
     brand_filter.pop("synonyms_path", None)
     filters["brand_synonyms"] = brand_filter
 
-    exists = await asyncio.to_thread(es.indices.exists, index=settings.es_index)
-    if exists:
-        return
     logger.info("Creating index %s using %s", settings.es_index, mapping_path)
     try:
-        await asyncio.to_thread(es.indices.create, index=settings.es_index, body=body)
+        await es.indices.create(index=settings.es_index, body=body)
     except BadRequestError as exc:
         if getattr(exc, "error", "") == "resource_already_exists_exception":
             logger.info("Index %s already exists", settings.es_index)
@@ -60,16 +91,16 @@ async def ensure_index(es: Elasticsearch) -> None:
         raise
 
 
-async def drop_index(es: Elasticsearch) -> None:
+async def drop_index(es: AsyncElasticsearch) -> None:
     try:
-        await asyncio.to_thread(es.indices.delete, index=settings.es_index)
+        await es.indices.delete(index=settings.es_index)
     except NotFoundError:
         return
 
 
-async def index_is_empty(es: Elasticsearch) -> bool:
+async def index_is_empty(es: AsyncElasticsearch) -> bool:
     try:
-        stats = await asyncio.to_thread(es.count, index=settings.es_index)
+        stats = await es.count(index=settings.es_index)
         return stats.get("count", 0) == 0
     except NotFoundError:
         return True
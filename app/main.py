@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from pathlib import Path
 from typing import List
 
 from fastapi import FastAPI, HTTPException, Query
@@ -10,12 +12,14 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from .config import settings
-from .es_client import get_client
+from .es_client import close_async_client, get_async_client
 from .importer import import_if_empty, reindex_data
 from .indexing import ensure_index, index_is_empty
 from .models import ProductResult, SearchResponse
 from .search import search_products
 
+DEFAULT_SEARCH_LIMIT = 50
+
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 LOG_LEVEL = logging.getLevelName(settings.log_level.upper())
 
@@ -29,30 +33,68 @@ for name in ("uvicorn", "uvicorn.error", "uvicorn.access", "elastic_transport"):
 logger = logging.getLogger(__name__)
 logger.info("Logging configured at %s", settings.log_level.upper())
 
+# Load balancers poll /health continuously; answer repeats from memory briefly.
+HEALTH_CACHE_TTL_SECONDS = 2.0
+_health_cache: tuple[float, dict] | None = None
+# Strong references keep fire-and-forget startup tasks from being collected.
+_background_tasks: set[asyncio.Task] = set()
+
 app = FastAPI(title="Product Search Service")
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
+async def _warm_up(path: Path) -> None:
+    """Replay known frequent queries so the first user searches hit warm caches."""
+
+    try:
+        queries = [line.strip() for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    except OSError as exc:
+        logger.warning("Skipping search warm-up: cannot read %s (%s)", path, exc)
+        return
+    es = get_async_client()
+    for query in queries:
+        try:
+            await search_products(es, settings.es_index, query, DEFAULT_SEARCH_LIMIT)
+        except Exception as exc:
+            logger.warning("Warm-up query %r failed: %s", query, exc)
+    logger.info("Warmed up %s search queries from %s", len(queries), path)
+
+
 @app.on_event("startup")
 async def startup_event() -> None:
-    es = get_client()
+    es = get_async_client()
     await ensure_index(es)
     if settings.load_on_startup:
         imported = await import_if_empty(es)
         if imported:
             logger.info("Imported %s products on startup", imported)
+    if settings.warmup_queries_path:
+        task = asyncio.create_task(_warm_up(Path(settings.warmup_queries_path)))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    await close_async_client()
 
 
 @app.get("/health")
 async def health() -> dict:
-    es = get_client()
-    status = await asyncio.to_thread(es.cluster.health)
+    global _health_cache
+    now = time.monotonic()
+    if _health_cache is not None and now - _health_cache[0] < HEALTH_CACHE_TTL_SECONDS:
+        return dict(_health_cache[1])
+    es = get_async_client()
+    status = await es.cluster.health()
     empty = await index_is_empty(es)
-    return {
+    payload = {
         "elasticsearch": status.get("status"),
         "index": settings.es_index,
         "empty": empty,
     }
+    _health_cache = (now, payload)
+    return dict(payload)
 
 
 @app.get("/", include_in_schema=False)
@@ -61,10 +103,12 @@ async def root() -> FileResponse:
 
 
 @app.get("/search", response_model=SearchResponse)
-async def search(q: str = Query(..., description="Search query"), limit: int = 50) -> SearchResponse:
+async def search(
+    q: str = Query(..., description="Search query"), limit: int = DEFAULT_SEARCH_LIMIT
+) -> SearchResponse:
     if not q.strip():
         raise HTTPException(status_code=400, detail="Query must not be empty")
-    es = get_client()
+    es = get_async_client()
     payload = await search_products(es, settings.es_index, q, limit)
     products: List[ProductResult] = [ProductResult(**item) for item in payload["results"]]
     return SearchResponse(query=payload["query"], classification="unknown", results=products, took_ms=payload["took_ms"], eta_ms=payload["took_ms"])
@@ -72,6 +116,6 @@ async def search(q: str = Query(..., description="Search query"), limit: int = 5
 
 @app.post("/reindex")
 async def reindex() -> dict:
-    es = get_client()
+    es = get_async_client()
     count = await reindex_data(es)
     return {"indexed": count}
@@ -17,6 +17,8 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
+from functools import lru_cache
 from typing import Iterable
 
 from metaphone import doublemetaphone
@@ -24,18 +26,29 @@ from unidecode import unidecode
 
 logger = logging.getLogger(__name__)
 
-# Regex that keeps only letters/digits/spaces during normalization.
-_LETTER_DIGIT_SPACE_RE = re.compile(r"[^0-9a-zA-Zа-яА-ЯёЁ ]+")
-# Collapse consecutive Cyrillic or Latin letters (e.g. "зоооп" -> "зоп").
-_REPEATED_LETTER_RE = re.compile(r"([A-Za-zА-Яа-яЁё])\1+")
-# After transliteration we keep only Latin letters/digits/spaces for metaphone.
-_ASCII_ALNUM_SPACE_RE = re.compile(r"[^0-9a-zA-Z ]+")
+# Splitting on this keeps only letters/digits as tokens during normalization.
+_NON_LETTER_DIGIT_RE = re.compile(r"[^0-9a-zA-Zа-яА-ЯёЁ]+")
+# Collapse consecutive Cyrillic or Latin letters (e.g. "зоооп" -> "зоп"). Only the
+# repeats after the first letter are matched, so they are deleted with a literal
+# "" replacement instead of going through a group template.
+_REPEATED_LETTER_RE = re.compile(r"(?<=([A-Za-zА-Яа-яЁё]))\1+")
+# ASCII-only variant for the common Latin-script query shape.
+_ASCII_REPEATED_LETTER_RE = re.compile(r"(?<=([a-z]))\1+")
+# After transliteration we keep only Latin letters/digits tokens for metaphone.
+_NON_ASCII_ALNUM_RE = re.compile(r"[^0-9a-zA-Z]+")
+# Byte table mapping everything outside [0-9A-Za-z] to a space.
+_ASCII_WORD_DELIMITERS = bytes(
+    code if chr(code).isascii() and chr(code).isalnum() else ord(" ") for code in range(256)
+)
+# Search traffic repeats the same queries (autocomplete, retries, paging).
+QUERY_CACHE_SIZE = 4096
 # Phonetic harmonization rules to align common digraphs before transliteration.
-_PHONETIC_REWRITE_RULES: tuple[tuple[re.Pattern[str], str], ...] = (
-    (re.compile(r"sch"), "ш"),
-    (re.compile(r"sh"), "ш"),
-    (re.compile(r"zh"), "ж"),
-    (re.compile(r"ch"), "ч"),
+# Applied in order as literal replacements; every digraph ends in "h".
+_PHONETIC_REWRITE_RULES: tuple[tuple[str, str], ...] = (
+    ("sch", "ш"),
+    ("sh", "ш"),
+    ("zh", "ж"),
+    ("ch", "ч"),
 )
 
 # Minimal brand synonym dictionary applied before phonetics. This mirrors the
@@ -188,6 +201,91 @@ BRAND_SYNONYMS: dict[str, str] = {
 }
 
 
+def _split_words(text: str) -> list[str]:
+    """Lowercase, collapse repeated letters and split into letter/digit words."""
+
+    lowered = text.lower()
+    if lowered.isascii():
+        return _split_ascii_alnum(_ASCII_REPEATED_LETTER_RE.sub("", lowered))
+    collapsed = _REPEATED_LETTER_RE.sub("", lowered)
+    # Splitting on the stripped characters cleans, compacts and tokenizes at once.
+    return [word for word in _NON_LETTER_DIGIT_RE.split(collapsed) if word]
+
+
+def _split_ascii_alnum(text: str) -> list[str]:
+    """Split into runs of ASCII letters/digits, dropping everything else."""
+
+    if text.isascii():
+        # Blank out every non-alphanumeric byte and split, which yields exactly
+        # the runs of [0-9A-Za-z] without entering the regex engine.
+        return text.encode("ascii").translate(_ASCII_WORD_DELIMITERS).decode("ascii").split()
+    return [word for word in _NON_ASCII_ALNUM_RE.split(text) if word]
+
+
+def _normalize_synonym_aliases(synonyms: dict[str, str]) -> dict[tuple[str, ...], str]:
+    """Key each alias by the words :func:`normalize_query` would produce for it.
+
+    Aliases such as ``"nissan"`` or ``"range-rover"`` only match once they go
+    through the same repeat collapsing and punctuation splitting as the input.
+    Each canonical is also registered under its own collapsed form, so that
+    ``"caterpillar"`` (seen as ``"caterpilar"``) maps back to itself and
+    normalization stays idempotent.
+    """
+
+    aliases = {
+        tuple(sys.intern(word) for word in words): sys.intern(canonical)
+        for alias, canonical in synonyms.items()
+        if (words := _split_words(alias))
+    }
+    for canonical in set(synonyms.values()):
+        if words := _split_words(canonical):
+            aliases.setdefault(tuple(sys.intern(word) for word in words), sys.intern(canonical))
+    return aliases
+
+
+def _bucket_synonym_phrases(
+    aliases: dict[tuple[str, ...], str],
+) -> dict[str, tuple[tuple[tuple[str, ...], str], ...]]:
+    """Group multi-word aliases by first word, longest first, for greedy matching."""
+
+    buckets: dict[str, tuple[tuple[tuple[str, ...], str], ...]] = {}
+    for words, canonical in sorted(aliases.items(), key=lambda item: -len(item[0])):
+        if len(words) > 1:
+            buckets[words[0]] = buckets.get(words[0], ()) + ((words, canonical),)
+    return buckets
+
+
+_NORMALIZED_SYNONYMS = _normalize_synonym_aliases(BRAND_SYNONYMS)
+_SINGLE_WORD_SYNONYMS = {
+    words[0]: canonical for words, canonical in _NORMALIZED_SYNONYMS.items() if len(words) == 1
+}
+# Multi-word aliases ("range rover") cannot be found by a per-token lookup.
+_SYNONYM_PHRASES_BY_FIRST = _bucket_synonym_phrases(_NORMALIZED_SYNONYMS)
+# Any word that can start a replacement; queries without one pass through as-is.
+_SYNONYM_TRIGGERS = frozenset(_SINGLE_WORD_SYNONYMS) | frozenset(_SYNONYM_PHRASES_BY_FIRST)
+
+
+def _apply_synonyms(words: list[str]) -> list[str]:
+    if _SYNONYM_TRIGGERS.isdisjoint(words):
+        return words
+    phrases_for = _SYNONYM_PHRASES_BY_FIRST.get
+    canonical_for = _SINGLE_WORD_SYNONYMS.get
+    tokens: list[str] = []
+    idx = 0
+    while idx < len(words):
+        word = words[idx]
+        for phrase, canonical in phrases_for(word, ()):
+            if tuple(words[idx : idx + len(phrase)]) == phrase:
+                tokens.append(canonical)
+                idx += len(phrase)
+                break
+        else:
+            tokens.append(canonical_for(word, word))
+            idx += 1
+    return tokens
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
 def normalize_query(text: str) -> str:
     """Normalize free-form input prior to search and phonetics.
 
@@ -200,7 +298,8 @@ def normalize_query(text: str) -> str:
     4. Collapse multiple spaces and trim.
     5. Apply a tiny Python-side synonym map so colloquial brand aliases map to
        canonical tokens (e.g. ``"мерс"`` → ``"мерседес"``, ``"беха"`` →
-       ``"bmw"``) before phonetic generation.
+       ``"bmw"``) before phonetic generation. Multi-word aliases such as
+       ``"range rover"`` are matched greedily, longest first.
 
     Notes
     -----
@@ -211,32 +310,36 @@ def normalize_query(text: str) -> str:
     flagged in PR review (e.g. ``"bosch"`` turning into ``"boш"``).
     """
 
-    lowered = (text or "").lower()
-    collapsed = _REPEATED_LETTER_RE.sub(r"\1", lowered)
-    cleaned = _LETTER_DIGIT_SPACE_RE.sub(" ", collapsed)
-    compact = " ".join(cleaned.split())
-    logger.debug(
-        "normalize_query raw=%r lowered=%r collapsed=%r cleaned=%r compact=%r",
-        text,
-        lowered,
-        collapsed,
-        cleaned,
-        compact,
-    )
-    if not compact:
+    words = _split_words(text or "")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("normalize_query raw=%r words=%s", text, words)
+    if not words:
         logger.debug("normalize_query empty after cleaning")
         return ""
 
-    tokens = [BRAND_SYNONYMS.get(token, token) for token in compact.split()]
+    tokens = _apply_synonyms(words)
     normalized = " ".join(tokens)
-    logger.info(
-        "normalize_query tokens=%s -> normalized=%r",
-        tokens,
-        normalized,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "normalize_query tokens=%s -> normalized=%r",
+            tokens,
+            normalized,
+        )
     return normalized
 
 
+@lru_cache(maxsize=16384)
+def _unidecode_token(token: str) -> str:
+    return unidecode(token)
+
+
+def _unidecode_words(text: str) -> str:
+    # unidecode maps code point by code point, so word-wise output is identical
+    # and the per-token cache turns the recurring vocabulary into lookups.
+    return " ".join(map(_unidecode_token, text.split(" ")))
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
 def transliterate_text(text: str) -> str:
     """Transliterate arbitrary text into ASCII while keeping tokens searchable.
 
@@ -245,24 +348,23 @@ def transliterate_text(text: str) -> str:
 
     1. Normalize (lowercase + collapse repeats + strip punctuation).
     2. Transliterate Cyrillic → Latin using ``unidecode``.
-    3. Remove any leftover non-alphanumeric symbols.
-    4. Collapse whitespace.
+    3. Split on any leftover non-alphanumeric symbols and rejoin with single
+       spaces.
     """
 
     normalized = normalize_query(text)
     if not normalized:
         return ""
-    transliterated = unidecode(normalized)
-    ascii_only = _ASCII_ALNUM_SPACE_RE.sub(" ", transliterated)
-    compact = " ".join(ascii_only.split())
-    logger.info(
-        "transliterate_text raw=%r normalized=%r transliterated=%r ascii=%r compact=%r",
-        text,
-        normalized,
-        transliterated,
-        ascii_only,
-        compact,
-    )
+    transliterated = _unidecode_words(normalized)
+    compact = " ".join(_split_ascii_alnum(transliterated))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "transliterate_text raw=%r normalized=%r transliterated=%r compact=%r",
+            text,
+            normalized,
+            transliterated,
+            compact,
+        )
     return compact
 
 
@@ -276,22 +378,27 @@ def _apply_phonetic_overrides(value: str) -> str:
     Cyrillic spellings without adding runtime analyzers or extra ES filters.
     """
 
+    if "h" not in value:
+        return value
     adjusted = value
-    for pattern, replacement in _PHONETIC_REWRITE_RULES:
-        adjusted = pattern.sub(replacement, adjusted)
+    for digraph, replacement in _PHONETIC_REWRITE_RULES:
+        adjusted = adjusted.replace(digraph, replacement)
     return adjusted
 
 
+@lru_cache(maxsize=16384)
+def _token_metaphone(token: str) -> tuple[str, str]:
+    # Product titles share a small vocabulary, so most tokens repeat.
+    return doublemetaphone(token)
+
+
 def _metaphone_tokens(tokens: Iterable[str]) -> list[str]:
-    phonetics: list[str] = []
-    for token in tokens:
-        primary, secondary = doublemetaphone(token)
-        for code in (primary, secondary):
-            if code and code not in phonetics:
-                phonetics.append(code)
-    return phonetics
+    phonetics = dict.fromkeys(code for token in tokens for code in _token_metaphone(token))
+    phonetics.pop("", None)
+    return list(phonetics)
 
 
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
 def to_phonetic(normalized_text: str) -> str:
     """Generate a phonetic key from **already normalized** text.
 
@@ -311,21 +418,20 @@ def to_phonetic(normalized_text: str) -> str:
             logger.debug("to_phonetic skipped: empty normalized text")
             return ""
         harmonized = _apply_phonetic_overrides(normalized_text)
-        transliterated = unidecode(harmonized)
-        ascii_only = _ASCII_ALNUM_SPACE_RE.sub(" ", transliterated)
-        tokens = ascii_only.split()
+        transliterated = _unidecode_words(harmonized)
+        tokens = _split_ascii_alnum(transliterated)
         codes = _metaphone_tokens(tokens)
         phonetic = " ".join(codes)
-        logger.info(
-            "to_phonetic normalized=%r harmonized=%r transliterated=%r ascii=%r tokens=%s codes=%s phonetic=%r",
-            normalized_text,
-            harmonized,
-            transliterated,
-            ascii_only,
-            tokens,
-            codes,
-            phonetic,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "to_phonetic normalized=%r harmonized=%r transliterated=%r tokens=%s codes=%s phonetic=%r",
+                normalized_text,
+                harmonized,
+                transliterated,
+                tokens,
+                codes,
+                phonetic,
+            )
         return phonetic
     except Exception as exc:  # pragma: no cover - defensive guardrail
         logger.debug("phonetic conversion failed for %r: %s", normalized_text, exc)
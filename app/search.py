@@ -3,10 +3,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, List
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch
 
+from .indexing import mapping_replica_count
 from .phonetics import normalize_query, to_phonetic, transliterate_text
 
 logger = logging.getLogger(__name__)
@@ -29,9 +32,30 @@ PHONETIC_FIELDS = [
     "phonetic",
 ]
 CODE_FIELDS = ["productCode^2", "productCode.numeric"]
+# Only the fields ProductResult exposes are shipped back from Elasticsearch.
+# Callers that show fewer fields can pass a narrower tuple of their own.
+SOURCE_FIELDS: Tuple[str, ...] = (
+    "externalId",
+    "manufacturer",
+    "productCode",
+    "title",
+    "phonetic",
+    "price",
+    "category",
+    "currency",
+)
 
 
-def _build_query(normalized_q: str, transliterated_q: str, phonetic_q: str | None, limit: int) -> Dict[str, Any]:
+# Built bodies are pure functions of their arguments and are only read by the
+# client when it serializes them, so repeated queries share one instance.
+@lru_cache(maxsize=2048)
+def _build_query(
+    normalized_q: str,
+    transliterated_q: str,
+    phonetic_q: str | None,
+    limit: int,
+    source_fields: Tuple[str, ...] = SOURCE_FIELDS,
+) -> Dict[str, Any]:
     should: List[dict] = []
 
     should.append(
@@ -102,6 +126,9 @@ def _build_query(normalized_q: str, transliterated_q: str, phonetic_q: str | Non
 
     query = {
         "size": limit,
+        "_source": source_fields,
+        # Results are never paged by total, so skip exact hit counting.
+        "track_total_hits": False,
         "query": {
             "bool": {
                 "should": should,
@@ -114,35 +141,115 @@ def _build_query(normalized_q: str, transliterated_q: str, phonetic_q: str | Non
     return query
 
 
-async def search_products(es: Elasticsearch, index: str, q: str, limit: int = 50) -> dict:
+@lru_cache(maxsize=1)
+def _routes_by_preference() -> bool:
+    # With a single copy of each shard there is nothing to choose between, so
+    # a preference would only cost a hash and a query parameter per search.
+    return mapping_replica_count() > 0
+
+
+def _search_preference(normalized_q: str) -> str | None:
+    if not _routes_by_preference():
+        return None
+    # crc32 is stable across processes (unlike hash()), and the prefix keeps
+    # the value clear of the reserved "_"-prefixed preference keywords.
+    return f"q{zlib.crc32(normalized_q.encode('utf-8')):08x}"
+
+
+# Searches currently waiting on Elasticsearch, keyed by everything the request
+# body depends on. Concurrent identical searches share one round-trip.
+_inflight: Dict[tuple, "asyncio.Future[dict]"] = {}
+
+
+async def search_products(
+    es: AsyncElasticsearch,
+    index: str,
+    q: str,
+    limit: int = 50,
+    source_fields: Tuple[str, ...] = SOURCE_FIELDS,
+) -> dict:
     # Step 1: normalize raw user input (Russian/English) with collapsing repeats
     # and light synonym handling so phonetics and analyzers see a clean string.
-    normalized_q = normalize_query(q)
+    # Case and spacing variants normalize identically, so fold them up front to
+    # share one normalize_query cache entry.
+    normalized_q = normalize_query(" ".join(q.lower().split()))
+    key = (index, normalized_q, limit, source_fields)
+    pending = _inflight.get(key)
+    if pending is not None:
+        try:
+            shared = await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise
+            # The leading request was cancelled; run the search ourselves.
+        else:
+            # Each waiter gets its own payload and result list, so one caller
+            # reordering or trimming its results cannot affect the others.
+            return {**shared, "results": list(shared["results"])}
+
+    future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        payload = await _execute_search(es, index, q, normalized_q, limit, source_fields)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        # Mark the exception as retrieved in case nobody else was waiting.
+        future.exception()
+        raise
+    else:
+        future.set_result(payload)
+        return payload
+    finally:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+
+async def _execute_search(
+    es: AsyncElasticsearch,
+    index: str,
+    q: str,
+    normalized_q: str,
+    limit: int,
+    source_fields: Tuple[str, ...],
+) -> dict:
     # Step 2: transliterate the normalized string for Latin-friendly matching.
     transliterated_q = transliterate_text(normalized_q)
     # Step 3: derive a phonetic key from the normalized string.
     phonetic_q = to_phonetic(normalized_q) if normalized_q else ""
-    query_body = _build_query(normalized_q, transliterated_q, phonetic_q, limit)
+    query_body = _build_query(normalized_q, transliterated_q, phonetic_q, limit, source_fields)
 
-    response = await asyncio.to_thread(es.search, index=index, body=query_body)
+    # Identical queries produce an identical body, which the shard request
+    # cache can answer without re-running the search. When the index has
+    # replicas, a stable preference sends them to the same shard copies so
+    # that cache is warmed once rather than on every copy.
+    response = await es.search(
+        index=index,
+        body=query_body,
+        request_cache=True,
+        preference=_search_preference(normalized_q),
+    )
     hits = response.get("hits", {}).get("hits", [])
-    results = [
-        {
-            **(hit.get("_source", {})),
-            "score": hit.get("_score"),
-        }
-        for hit in hits
-    ]
+    results = []
+    for hit in hits:
+        # Each response is freshly decoded, so the hit's _source dict can be
+        # reused as the result instead of being copied.
+        source = hit.get("_source") or {}
+        source["score"] = hit.get("_score")
+        results.append(source)
     took_ms = response.get("took", 0)
-    logger.info(
-        "search q=%r normalized=%r translit=%r phonetic=%r hits=%s took=%sms",
-        q,
-        normalized_q,
-        transliterated_q,
-        phonetic_q,
-        len(results),
-        took_ms,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "search q=%r normalized=%r translit=%r phonetic=%r hits=%s took=%sms",
+            q,
+            normalized_q,
+            transliterated_q,
+            phonetic_q,
+            len(results),
+            took_ms,
+        )
     return {
         "query": normalized_q,
         "results": results,
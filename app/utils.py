@@ -8,9 +8,11 @@ here.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 CYRILLIC_PATTERN = re.compile(r"[А-Яа-яЁё]")
+NON_ALNUM_PATTERN = re.compile(r"[^0-9A-Za-z]+")
 
 # Simple transliteration map (Russian -> Latin). This is not exhaustive but
 # covers common brand name characters.
@@ -52,32 +54,42 @@ RU_TO_LATIN = {
 LATIN_TO_RU = {v: k for k, v in RU_TO_LATIN.items() if v}
 
 
+def _case_insensitive_table(mapping: dict[str, str]) -> dict[int, str]:
+    """Build a ``str.translate`` table that also maps the upper-case forms."""
+    table: dict[int, str] = {}
+    for char, replacement in mapping.items():
+        for variant in (char, char.upper(), char.title()):
+            if len(variant) == 1 and variant.lower() == char:
+                table[ord(variant)] = replacement
+    return table
+
+
+RU_TO_LATIN_TABLE = _case_insensitive_table(RU_TO_LATIN)
+
+
+# Multi-letter Latin chunks are replaced first (longest alternative wins at each
+# position); the remaining single letters then go through one translate call.
+LATIN_MULTI_CHUNK_PATTERN = re.compile(
+    "|".join(re.escape(chunk) for chunk in sorted((c for c in LATIN_TO_RU if len(c) > 1), key=len, reverse=True))
+)
+LATIN_TO_RU_TABLE = str.maketrans({chunk: ru for chunk, ru in LATIN_TO_RU.items() if len(chunk) == 1})
+
+
 def normalize_code(code: Optional[str]) -> str:
     """Remove non-alphanumeric characters and uppercase the code."""
     if not code:
         return ""
-    return re.sub(r"[^0-9A-Za-z]", "", code).upper()
+    return NON_ALNUM_PATTERN.sub("", code).upper()
 
 
+@lru_cache(maxsize=4096)
 def transliterate_query(q: str) -> str:
     """Switch between Cyrillic and Latin alphabets for fuzzy matching."""
     if not q:
         return ""
     if CYRILLIC_PATTERN.search(q):
-        return "".join(RU_TO_LATIN.get(ch.lower(), ch) for ch in q)
+        return q.translate(RU_TO_LATIN_TABLE)
     # naive latin->ru by chunk matching
-    result: list[str] = []
-    idx = 0
     lower_q = q.lower()
-    while idx < len(lower_q):
-        matched = False
-        for latin, ru in sorted(LATIN_TO_RU.items(), key=lambda kv: -len(kv[0])):
-            if lower_q.startswith(latin, idx):
-                result.append(ru)
-                idx += len(latin)
-                matched = True
-                break
-        if not matched:
-            result.append(lower_q[idx])
-            idx += 1
-    return "".join(result)
+    with_chunks = LATIN_MULTI_CHUNK_PATTERN.sub(lambda match: LATIN_TO_RU[match.group()], lower_q)
+    return with_chunks.translate(LATIN_TO_RU_TABLE)
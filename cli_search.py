@@ -3,25 +3,73 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import sys
+import time
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
+
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # uvicorn[standard] installs it everywhere but Windows/PyPy
+    uvloop = None
 
 from app.config import settings
-from app.es_client import get_client
-from app.search import search_products
+from app.es_client import MIN_CONNECTIONS_PER_NODE, close_async_client, get_async_client
+from app.phonetics import normalize_query
+from app.search import SOURCE_FIELDS, search_products
 
 MAX_RESULTS = 100
+# Hits requested per query unless --top asks for more (capped at MAX_RESULTS).
+DEFAULT_TOP = 20
+# pretty_print_response shows only these (plus the hit score).
+PRINTED_FIELDS = ("manufacturer", "productCode", "title")
+# Batch queries kept in flight at once; results are still printed in file order.
+# Matches the client's smallest connection pool so every search gets its own.
+BATCH_CONCURRENCY = MIN_CONNECTIONS_PER_NODE
 GREEN = "\033[92m"
 RED = "\033[91m"
 RESET = "\033[0m"
-
-
-async def perform_query(query: str) -> dict:
-    es = get_client()
-    return await search_products(es, settings.es_index, query, limit=MAX_RESULTS)
-
-
-def interactive_shell() -> None:
+# Recent responses keyed by normalized query, so retyped queries skip the
+# Elasticsearch round-trip for a short while.
+QUERY_CACHE_SIZE = 256
+QUERY_CACHE_TTL_SECONDS = 60.0
+
+_query_cache: OrderedDict[tuple[str, int, tuple[str, ...]], tuple[float, dict]] = OrderedDict()
+
+
+async def perform_query(
+    query: str,
+    limit: int = DEFAULT_TOP,
+    source_fields: tuple[str, ...] = PRINTED_FIELDS,
+    use_cache: bool = True,
+) -> dict:
+    limit = min(max(limit, 1), MAX_RESULTS)
+    es = get_async_client()
+    if not use_cache:
+        return await search_products(es, settings.es_index, query, limit=limit, source_fields=source_fields)
+
+    started = time.perf_counter()
+    key = (normalize_query(" ".join(query.lower().split())), limit, source_fields)
+    cached = _query_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < QUERY_CACHE_TTL_SECONDS:
+        _query_cache.move_to_end(key)
+        # Report this lookup's own time, not the latency of the search that
+        # originally filled the entry.
+        took_ms = (time.perf_counter() - started) * 1000
+        return {**cached[1], "took_ms": took_ms, "cached": True}
+
+    response = await search_products(es, settings.es_index, query, limit=limit, source_fields=source_fields)
+    _query_cache[key] = (time.monotonic(), response)
+    _query_cache.move_to_end(key)
+    if len(_query_cache) > QUERY_CACHE_SIZE:
+        _query_cache.popitem(last=False)
+    return response
+
+
+async def interactive_shell(limit: int = DEFAULT_TOP) -> None:
     print("Interactive product search. Type 'exit' to quit.")
     while True:
         try:
@@ -33,7 +81,7 @@ def interactive_shell() -> None:
             continue
         if query.lower() in {"exit", "quit"}:
             return
-        response = asyncio.run(perform_query(query))
+        response = await perform_query(query, limit)
         pretty_print_response(query, response)
 
 
@@ -42,40 +90,106 @@ def pretty_print_response(query: str, payload: dict) -> None:
     eta = float(payload.get("eta_ms", payload.get("took_ms", 0)))
     color = GREEN if eta < 200 else RED
     eta_label = f"{color}{eta:.1f} ms{RESET}"
-    print(f"Query: {query} | results: {len(results)} | ETA: {eta_label}")
+    if payload.get("cached"):
+        eta_label += " (cached)"
+    # Build the whole block first so each response is a single stdout write.
+    lines = [f"Query: {query} | results: {len(results)} | ETA: {eta_label}"]
     for idx, item in enumerate(results[:MAX_RESULTS], start=1):
         score = item.get("score")
         score_repr = f"{score:.2f}" if isinstance(score, (int, float)) else "-"
-        print(
+        lines.append(
             f"  {idx:02d}. score={score_repr} | {item.get('manufacturer')} | "
             f"{item.get('productCode')} | {item.get('title')}"
         )
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+
+
+def minimal_print_response(query: str, payload: dict) -> None:
+    eta = float(payload.get("eta_ms", payload.get("took_ms", 0)))
+    sys.stdout.write(f"{query}\t{len(payload.get('results', []))}\t{eta:.1f}\n")
+
+
+def jsonl_print_response(query: str, payload: dict) -> None:
+    sys.stdout.buffer.write(orjson.dumps({"input": query, **payload}) + b"\n")
+
 
+async def batch_mode(
+    file_path: Path,
+    concurrency: int = BATCH_CONCURRENCY,
+    limit: int = DEFAULT_TOP,
+    printer: Callable[[str, dict], None] = pretty_print_response,
+    source_fields: tuple[str, ...] = PRINTED_FIELDS,
+    use_cache: bool = True,
+) -> None:
+    pending: deque[tuple[str, asyncio.Task]] = deque()
 
-def batch_mode(file_path: Path) -> None:
-    with file_path.open("r", encoding="utf-8") as fh:
-        for line in fh:
-            query = line.strip()
-            if not query:
-                continue
-            response = asyncio.run(perform_query(query))
-            pretty_print_response(query, response)
+    async def print_oldest() -> None:
+        query, task = pending.popleft()
+        printer(query, await task)
+
+    # One read for the whole file; query dumps are small next to the searches.
+    for line in file_path.read_text(encoding="utf-8").splitlines():
+        query = line.strip()
+        if not query:
+            continue
+        pending.append((query, asyncio.create_task(perform_query(query, limit, source_fields, use_cache))))
+        if len(pending) >= max(concurrency, 1):
+            await print_oldest()
+    while pending:
+        await print_oldest()
+
+
+async def run(args: argparse.Namespace) -> None:
+    # A single event loop owns the async client for the whole session.
+    try:
+        if args.batch:
+            source_fields = PRINTED_FIELDS
+            if args.jsonl:
+                # JSON records carry the full document, not just the printed columns.
+                printer, source_fields = jsonl_print_response, SOURCE_FIELDS
+            elif args.quiet:
+                printer = minimal_print_response
+            else:
+                printer = pretty_print_response
+            # Machine-readable runs report real latencies, never replayed ones.
+            use_cache = printer is pretty_print_response
+            await batch_mode(args.batch, args.concurrency, args.top, printer, source_fields, use_cache)
+        elif args.query:
+            response = await perform_query(args.query, args.top)
+            pretty_print_response(args.query, response)
+        else:
+            await interactive_shell(args.top)
+    finally:
+        await close_async_client()
 
 
 def main(argv: Iterable[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="CLI client for the search service")
     parser.add_argument("query", nargs="?", help="Query string. If omitted, starts REPL mode.")
     parser.add_argument("--batch", type=Path, help="File with queries to execute line by line")
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        help=f"Hits to fetch and print per query (default: {DEFAULT_TOP}, max: {MAX_RESULTS})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=BATCH_CONCURRENCY,
+        help=f"Batch queries kept in flight at once (default: {BATCH_CONCURRENCY})",
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--quiet", action="store_true", help="Batch mode: print only query, hit count and ETA")
+    output.add_argument("--jsonl", action="store_true", help="Batch mode: print each response as a JSON line")
     args = parser.parse_args(list(argv) if argv is not None else None)
-
-    if args.batch:
-        batch_mode(args.batch)
-        return 0
-    if args.query:
-        response = asyncio.run(perform_query(args.query))
-        pretty_print_response(args.query, response)
-        return 0
-    interactive_shell()
+    if (args.quiet or args.jsonl) and not args.batch:
+        parser.error("--quiet and --jsonl require --batch")
+    if uvloop is not None:
+        uvloop.run(run(args))
+    else:
+        asyncio.run(run(args))
     return 0
 
 
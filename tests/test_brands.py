@@ -0,0 +1,34 @@
+"""Regression tests for brand normalization and fuzzy lookup."""
+
+from app.brands import _fuzzy_brand_lookup, normalize_brand_token
+
+BRAND_LOOKUP = {
+    "toyota": "toyota",
+    "kamaz": "kamaz",
+    "komatsu": "komatsu",
+    "caterpillar": "caterpillar",
+    "cat": "caterpillar",
+}
+
+
+def test_fuzzy_lookup_accepts_brand_attachments():
+    """Trailing words glued to a brand and truncated brands resolve."""
+
+    assert _fuzzy_brand_lookup("toyotamotor", BRAND_LOOKUP) == "toyota"
+    assert _fuzzy_brand_lookup("komat", BRAND_LOOKUP) == "komatsu"
+
+
+def test_fuzzy_lookup_tolerates_small_typos():
+    """Transpositions and single edits stay within the distance budget."""
+
+    assert _fuzzy_brand_lookup("tyoota", BRAND_LOOKUP) == "toyota"
+    assert _fuzzy_brand_lookup("caterpilar", BRAND_LOOKUP) == "caterpillar"
+    assert _fuzzy_brand_lookup("kamas", BRAND_LOOKUP) == "kamaz"
+    assert _fuzzy_brand_lookup("xyzzy", BRAND_LOOKUP) is None
+
+
+def test_normalize_brand_token_strips_punctuation_before_overrides():
+    """Trailing punctuation does not hide a token from the brand overrides."""
+
+    assert normalize_brand_token("КАТ.№") == normalize_brand_token("КАТ") == "caterpillar"
+    assert normalize_brand_token("Toyota!") == "toyota"
@@ -1,6 +1,6 @@
 """Regression tests for phonetic helpers."""
 
-from app.phonetics import normalize_query, to_phonetic
+from app.phonetics import BRAND_SYNONYMS, normalize_query, to_phonetic
 
 
 def test_normalize_query_keeps_latin_digraphs():
@@ -18,3 +18,25 @@ def test_to_phonetic_still_harmonizes_digraphs():
 
     assert normalized == "bosch"
     assert phonetic  # metaphone codes should be emitted
+
+
+def test_normalize_query_maps_multi_word_aliases():
+    """Aliases spanning several words are replaced as a whole."""
+
+    assert normalize_query("Range Rover sport") == "land rover sport"
+    assert normalize_query("range") == "range"
+
+
+def test_normalize_query_matches_aliases_with_repeated_letters():
+    """Aliases are collapsed like the input, so doubled letters still match."""
+
+    assert normalize_query("Doosan") == "doosan"
+    assert normalize_query("ниссан") == "nissan"
+
+
+def test_normalize_query_is_idempotent_for_brand_aliases():
+    """Canonical brands survive a second pass through normalization."""
+
+    for alias in BRAND_SYNONYMS:
+        normalized = normalize_query(alias)
+        assert normalize_query(normalized) == normalized, alias